@@ -1,4 +1,16 @@
-from .aimage import aimage  # noqa: F401
-from .alogger import alogger  # noqa: F401
-from .aparser import aparser  # noqa: F401
-from .ascraper import ascraper  # noqa: F401
+import importlib as _importlib
+from types import ModuleType as _ModuleType
+
+__all__ = ["aimage", "alogger", "aparser", "ascraper"]
+
+
+def __getattr__(name: str) -> _ModuleType:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = _importlib.import_module(f".{name}", __name__)
+    globals()[name] = module
+    return module
+
+
+def __dir__() -> "list[str]":
+    return sorted(set(globals()) | set(__all__))
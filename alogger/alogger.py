@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+import random
 import time
 from enum import Enum, auto
 from typing import Any
@@ -83,15 +84,111 @@ class Logger:
         format: str = "[{time}] [{name}] [{levelname}] {message}",
         datefmt: str = "%H:%M:%S",
         sep: str = " ",
+        rate: float | None = None,
+        burst: float = 10,
+        logger_rate: float | None = None,
+        logger_burst: float = 100,
+        sample: dict[Level, float] | None = None,
+        max_keys: int = 1024,
+        flush_interval: float = 10,
     ) -> None:
+        assert rate is None or rate > 0, "Rate must be positive"
+        assert burst >= 1, "Burst must be at least 1"
+        assert logger_rate is None or logger_rate > 0, "Logger rate must be positive"
+        assert logger_burst >= 1, "Logger burst must be at least 1"
+        assert all(
+            0 <= p <= 1 for p in (sample or {}).values()
+        ), "Sample probabilities must be between 0 and 1"
+        assert max_keys >= 1, "Max keys must be at least 1"
+        assert flush_interval > 0, "Flush interval must be positive"
         self.name = name
         self.level = level
         self.filename = filename
         self.format = format
         self.datefmt = datefmt
         self.sep = sep
-
-    def _log(self, level: Level, *msg: str) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.logger_rate = logger_rate
+        self.logger_burst = logger_burst
+        self.sample: dict[Level, float] = sample or {}
+        self.max_keys = max_keys
+        self.flush_interval = flush_interval
+        self._buckets: dict[tuple[Level, str], list[float]] = {}
+        self._logger_bucket: list[float] = [logger_burst, time.monotonic()]
+        self._suppressed: dict[tuple[Level, str], int] = {}
+        self._dropped = 0
+        self._dropped_level = Level.NOTSET
+        self._flushed = time.monotonic()
+
+    def _refill(
+        self, bucket: list[float], rate: float, burst: float, now: float
+    ) -> float:
+        bucket[0] = min(burst, bucket[0] + (now - bucket[1]) * rate)
+        bucket[1] = now
+        return bucket[0]
+
+    def _bucket(self, key: tuple[Level, str], now: float) -> list[float]:
+        bucket = self._buckets.pop(key, None)
+        if bucket is None:
+            if len(self._buckets) >= self.max_keys:
+                del self._buckets[next(iter(self._buckets))]
+            bucket = [self.burst, now]
+        self._buckets[key] = bucket
+        return bucket
+
+    def flush_suppressed(self) -> None:
+        suppressed, self._suppressed = self._suppressed, {}
+        dropped, self._dropped = self._dropped, 0
+        level, self._dropped_level = self._dropped_level, Level.NOTSET
+        self._flushed = time.monotonic()
+        if len(suppressed) == 1 and not dropped:
+            (level, key), count = suppressed.popitem()
+            self._emit(level, f"suppressed {count} similar messages: {key}")
+            return
+        for (key_level, _), count in suppressed.items():
+            dropped += count
+            if key_level.value > level.value:
+                level = key_level
+        if dropped:
+            self._emit(level, f"suppressed {dropped} messages")
+
+    def _log(self, level: Level, *msg: str, key: str | None = None) -> None:
+        sample = self.sample.get(level)
+        if sample is not None and random.random() >= sample:
+            return
+        if self.rate is None and self.logger_rate is None:
+            self._emit(level, *msg)
+            return
+        now = time.monotonic()
+        if (self._suppressed or self._dropped) and (
+            now - self._flushed >= self.flush_interval
+            or len(self._suppressed) >= self.max_keys
+        ):
+            self.flush_suppressed()
+        if self.logger_rate is not None and (
+            self._refill(self._logger_bucket, self.logger_rate, self.logger_burst, now)
+            < 1
+        ):
+            self._dropped += 1
+            if level.value > self._dropped_level.value:
+                self._dropped_level = level
+            return
+        _key = (level, key if key is not None else msg[0] if msg else "")
+        if self.rate is not None:
+            bucket = self._bucket(_key, now)
+            if self._refill(bucket, self.rate, self.burst, now) < 1:
+                self._suppressed[_key] = self._suppressed.get(_key, 0) + 1
+                return
+            bucket[0] -= 1
+        if self.logger_rate is not None:
+            self._logger_bucket[0] -= 1
+        count = self._suppressed.pop(_key, 0)
+        if count:
+            self._emit(level, f"suppressed {count} similar messages: {_key[1]}")
+        self._emit(level, *msg)
+
+    def _emit(self, level: Level, *msg: str) -> None:
         message = self.format.format(
             time=time.strftime(self.datefmt),
             name=self.name,
@@ -103,20 +200,20 @@ class Logger:
                 f.write(message)
         print(message)
 
-    def trace(self, *msg: str) -> None:
-        self._log(Level.TRACE, *msg)
+    def trace(self, *msg: str, key: str | None = None) -> None:
+        self._log(Level.TRACE, *msg, key=key)
 
-    def debug(self, *msg: str) -> None:
-        self._log(Level.DEBUG, *msg)
+    def debug(self, *msg: str, key: str | None = None) -> None:
+        self._log(Level.DEBUG, *msg, key=key)
 
-    def info(self, *msg: str) -> None:
-        self._log(Level.INFO, *msg)
+    def info(self, *msg: str, key: str | None = None) -> None:
+        self._log(Level.INFO, *msg, key=key)
 
-    def warning(self, *msg: str) -> None:
-        self._log(Level.WARNING, *msg)
+    def warning(self, *msg: str, key: str | None = None) -> None:
+        self._log(Level.WARNING, *msg, key=key)
 
-    def error(self, *msg: str) -> None:
-        self._log(Level.ERROR, *msg)
+    def error(self, *msg: str, key: str | None = None) -> None:
+        self._log(Level.ERROR, *msg, key=key)
 
-    def fatal(self, *msg: str) -> None:
-        self._log(Level.FATAL, *msg)
+    def fatal(self, *msg: str, key: str | None = None) -> None:
+        self._log(Level.FATAL, *msg, key=key)
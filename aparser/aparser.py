@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import importlib
 import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Callable
 
 
@@ -33,20 +35,42 @@ class Data:
         assert not self.name.startswith("__"), "Name cannot start with dunder"
 
 
+@dataclass
+class Command:
+    name: str
+    handler: str
+    description: str = ""
+    options: list[Option] | None = None
+    data: Data | None = None
+
+    def __post_init__(self) -> None:
+        assert ":" in self.handler, "Handler must be 'module:function'"
+
+    def load(self) -> Callable[[ReturnData], Any]:
+        module, function = self.handler.split(":", 1)
+        return getattr(importlib.import_module(module), function)
+
+
 class ReturnData:
-    def __init__(self) -> None:
-        self.__names__: dict[str, type] = {}
+    __slots__ = ()
 
     def __repr__(self) -> str:
         copy: dict[str, tuple[str, Any]] = {}
-        for name in self.__names__:
-            copy[name] = (self.__names__[name].__name__, getattr(self, name))
+        for name in type(self).__slots__:
+            if name != "__dict__" and hasattr(self, name):
+                value = getattr(self, name)
+                copy[name] = (type(value).__name__, value)
+        for name, value in getattr(self, "__dict__", {}).items():
+            copy[name] = (type(value).__name__, value)
         return copy.__repr__()
 
-    def __setattr__(self, __name: str, __value: Any) -> None:
-        if hasattr(self, "__names__"):
-            self.__names__[__name] = type(__value)
-        return super(ReturnData, self).__setattr__(__name, __value)
+
+@lru_cache(maxsize=128)
+def return_data_class(names: tuple[str, ...]) -> type[ReturnData]:
+    slots = tuple(name for name in names if name.isidentifier())
+    if len(slots) != len(names):
+        slots += ("__dict__",)
+    return type("ReturnData", (ReturnData,), {"__slots__": slots})
 
 
 class Parser:
@@ -55,10 +79,16 @@ class Parser:
         options: list[Option] | None = None,
         data: Data | None = None,
         args: list[str] = sys.argv,
+        commands: list[Command] | None = None,
     ) -> None:
+        assert not (data and commands), "Data cannot be used with commands"
         self.path = args.pop(0)
         self.args = args
         self.data: Data | None = data
+        self.commands: dict[str, Command] = {
+            command.name: command for command in commands or []
+        }
+        self.command: Command | None = None
         self.options = (
             [
                 Option(
@@ -71,6 +101,24 @@ class Parser:
             if options
             else []
         )
+        self._options: dict[str, Option] = {}
+        self._prefixes: dict[str, str | None] = {}
+        for option in self.options:
+            self._options[option.name] = option
+            if option.name == "help":
+                continue
+            for end in range(1, len(option.name)):
+                prefix = option.name[:end]
+                self._prefixes[prefix] = (
+                    option.name if prefix not in self._prefixes else None
+                )
+        self._defaults = [
+            (option.name, option.default) for option in self.options if option.default
+        ]
+        names = tuple(self._options)
+        if self.data and self.data.name not in self._options:
+            names += (self.data.name,)
+        self._return_data = return_data_class(names)
 
     def usage(self) -> str:
         data = ""
@@ -84,19 +132,48 @@ class Parser:
                 data += ">"
             else:
                 data += "]"
+        if self.commands:
+            data = "<command>"
         _usage = ""
-        _usage += f"Usage:\t{self.path}{' [options]' if self.options else ''}{f' {data}' if self.data else ''}"
+        _usage += f"Usage:\t{self.path}{' [options]' if self.options else ''}{f' {data}' if data else ''}"
+        if self.commands:
+            _usage += "\ncommands:"
+            for command in self.commands.values():
+                _usage += f"\n {command.name}\t{command.description}"
         if self.options:
             _usage += "\noptions:"
             for option in self.options:
-                _usage += f"\n --{option.name}{f'=<{option.argument.__name__}>' if option.argument else ''}\t{option.description}"
+                _usage += self._describe(option)
         return _usage
 
+    def _describe(self, option: Option) -> str:
+        return f"\n --{option.name}{f'=<{option.argument.__name__}>' if option.argument else ''}\t{option.description}"
+
+    def _resolve(self, arg: str) -> tuple[Option, bool] | None:
+        option = self._options.get(arg)
+        if option:
+            return option, False
+        if arg.startswith("no-"):
+            resolved = self._resolve(arg[3:])
+            if resolved and not resolved[1]:
+                return resolved[0], True
+        name = self._prefixes.get(arg)
+        if name:
+            return self._options[name], False
+        return None
+
+    def search(self, term: str) -> list[Option]:
+        return [
+            option
+            for option in self.options
+            if term in option.name or term in option.description
+        ]
+
     def parse(self) -> ReturnData:
-        data = ReturnData()
+        data = self._return_data()
         for i, arg in enumerate(self.args):
             if arg.startswith("--"):
-                arg = arg.replace("--", "")
+                arg = arg[2:]
                 value = ""
                 if "=" in arg:
                     try:
@@ -106,53 +183,42 @@ class Parser:
                         exit(1)
                 if arg == "help" or arg == "h":
                     if value:
-                        options = [
-                            option
-                            for option in self.options
-                            if value in option.name or value in option.description
-                        ]
                         _usage = "options:"
-                        for option in options:
-                            _usage += f"\n --{option.name}{f'=<{option.argument}>' if option.argument else ''}\t{option.description}"
+                        for option in self.search(value):
+                            _usage += self._describe(option)
                         print(_usage)
                     else:
                         print(self.usage())
                     exit(0)
-                if arg not in self.options and arg.replace("no-", "") not in self.options:  # type: ignore
+                resolved = self._resolve(arg)
+                if resolved is None:
                     print(self.usage())
                     exit(1)
-                if arg.startswith("no-"):
+                option, negated = resolved
+                if negated:
                     if value:
                         print(self.usage())
                         exit(1)
-                    arg = arg.replace("no-", "")
-                    setattr(data, arg, False)
+                    setattr(data, option.name, False)
+                elif value:
+                    try:
+                        setattr(data, option.name, option.argument(value))
+                    except ValueError:
+                        print(self.usage())
+                        exit(1)
                 else:
-                    if value:
-                        try:
-                            opt = [
-                                option for option in self.options if option.name == arg
-                            ]
-                            _type = opt[0].argument
-                            setattr(
-                                data,
-                                arg,
-                                _type(value),
-                            )
-                        except ValueError:
-                            print(self.usage())
-                            exit(1)
-                    else:
-                        setattr(data, arg, True)
-                if getattr(data, arg) is None:
+                    setattr(data, option.name, True)
+                if getattr(data, option.name) is None:
                     print(self.usage())
                     exit(1)
             else:
+                if self.commands:
+                    return self._parse_command(i)
                 if self.data:
                     _data = " ".join(self.args[i : len(self.args)])
                     if self.data.file:
                         try:
-                            setattr(data, arg, open(_data, "rb+"))
+                            setattr(data, self.data.name, open(_data, "rb+"))
                         except FileNotFoundError:
                             print(f"Cannot open file '{_data}': No such file")
                             exit(1)
@@ -162,11 +228,34 @@ class Parser:
                 else:
                     print(self.usage())
                     exit(1)
+        if self.commands:
+            print(self.usage())
+            exit(1)
         if self.data:
             if not getattr(data, self.data.name, None) and self.data.required:
                 print(self.usage())
                 exit(1)
-        for option in self.options:
-            if option.name not in data.__names__ and option.default:
-                setattr(data, option.name, option.default)
+        for name, default in self._defaults:
+            if not hasattr(data, name):
+                setattr(data, name, default)
         return data
+
+    def _parse_command(self, i: int) -> ReturnData:
+        command = self.commands.get(self.args[i])
+        if command is None:
+            print(self.usage())
+            exit(1)
+        self.command = command
+        parser = Parser(
+            self.options[1:] + (command.options or []),
+            command.data,
+            [f"{self.path} {command.name}"] + self.args[:i] + self.args[i + 1 :],
+        )
+        return parser.parse()
+
+    def run(self) -> Any:
+        data = self.parse()
+        if self.command is None:
+            print(self.usage())
+            exit(1)
+        return self.command.load()(data)
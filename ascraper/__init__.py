@@ -0,0 +1,9 @@
+from . import ascraper as _module
+
+
+def __getattr__(name: str) -> object:
+    return getattr(_module, name)
+
+
+def __dir__() -> "list[str]":
+    return sorted(set(globals()) | set(dir(_module)))
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENTRY = """\
+from alibrary.aparser.aparser import Command, Option, Parser
+
+Parser(
+    [Option("verbose", "print more output")],
+    commands=[
+        Command("image", "image_tool:main", "write an image"),
+        Command("scrape", "scrape_tool:main", "scrape a page"),
+    ],
+).run()
+"""
+
+TOOLS = {
+    "image_tool.py": "from alibrary.aimage import aimage\n\n\n"
+    "def main(data):\n    return aimage\n",
+    "scrape_tool.py": "from alibrary.ascraper import ascraper\n\n\n"
+    "def main(data):\n    return ascraper\n",
+}
+
+CASES: dict[str, tuple[list[str], list[str]]] = {
+    "--help": (["--help"], ["aimage", "ascraper", "urllib.request"]),
+    "image": (["image"], ["ascraper", "urllib.request"]),
+    "scrape": (["scrape"], ["aimage"]),
+}
+
+
+def importtime(directory: str, args: list[str]) -> dict[str, int] | None:
+    env = dict(os.environ, PYTHONPATH=directory)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", os.path.join(directory, "entry.py")]
+        + args,
+        cwd=directory,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode:
+        print(result.stderr, file=sys.stderr)
+        return None
+    modules: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def main() -> None:
+    failed = False
+    with tempfile.TemporaryDirectory() as directory:
+        os.symlink(ROOT, os.path.join(directory, "alibrary"))
+        with open(os.path.join(directory, "entry.py"), "w") as f:
+            f.write(ENTRY)
+        for filename, source in TOOLS.items():
+            with open(os.path.join(directory, filename), "w") as f:
+                f.write(source)
+        for case, (args, unused) in CASES.items():
+            modules = importtime(directory, args)
+            if modules is None:
+                print(f"{case}\tFAIL exited with an error")
+                failed = True
+                continue
+            loaded = [
+                name
+                for name in modules
+                if any(name == u or name.endswith(f".{u}") for u in unused)
+            ]
+            total = sum(
+                us for name, us in modules.items() if name.count(".") == 0
+            )
+            status = "ok" if not loaded else f"FAIL loaded {', '.join(loaded)}"
+            print(f"{case}\t{total}us\t{len(modules)} modules\t{status}")
+            failed = failed or bool(loaded)
+    exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
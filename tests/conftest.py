@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import importlib.util
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if "alibrary" not in sys.modules:
+    spec = importlib.util.spec_from_file_location(
+        "alibrary",
+        os.path.join(ROOT, "__init__.py"),
+        submodule_search_locations=[ROOT],
+    )
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["alibrary"] = module
+    spec.loader.exec_module(module)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="module")
+def path(tmp_path_factory) -> str:
+    directory = tmp_path_factory.mktemp("path")
+    os.symlink(ROOT, directory / "alibrary")
+    return str(directory)
+
+
+def run(path: str, source: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", source],
+        env=dict(os.environ, PYTHONPATH=path),
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip()
+
+
+def test_lazy_attribute(path: str) -> None:
+    assert (
+        run(
+            path,
+            "import sys, alibrary\n"
+            "assert 'alibrary.aimage' not in sys.modules\n"
+            "assert alibrary.aparser.Parser is alibrary.aparser.aparser.Parser\n"
+            "print(sorted(m for m in sys.modules if m.startswith('alibrary.')))",
+        )
+        == "['alibrary.aparser', 'alibrary.aparser.aparser']"
+    )
+
+
+def test_submodule_imported_first(path: str) -> None:
+    run(
+        path,
+        "from alibrary.aparser.aparser import Parser\n"
+        "import alibrary\n"
+        "assert alibrary.aparser.Parser is Parser\n"
+        "assert 'Parser' in dir(alibrary.aparser)",
+    )
+
+
+def test_dir(path: str) -> None:
+    names = eval(run(path, "import alibrary; alibrary.aparser; print(dir(alibrary))"))
+    assert len(names) == len(set(names))
+    assert {"aimage", "alogger", "aparser", "ascraper"} <= set(names)
+    assert not {"importlib", "ModuleType", "annotations"} & set(names)
+
+
+def test_unknown_attribute(path: str) -> None:
+    run(
+        path,
+        "import alibrary\n"
+        "try:\n    alibrary.missing\nexcept AttributeError:\n    pass\n"
+        "else:\n    raise SystemExit(1)",
+    )
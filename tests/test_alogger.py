@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from types import ModuleType
+
+import pytest
+
+
+@pytest.fixture
+def alogger(tmp_path, monkeypatch) -> ModuleType:
+    monkeypatch.chdir(tmp_path)
+    from alibrary.alogger import alogger
+
+    clock = [1000.0]
+    monkeypatch.setattr(alogger.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(alogger, "clock", clock, raising=False)
+    return alogger
+
+
+def lines(capsys) -> list[str]:
+    return capsys.readouterr().out.splitlines()
+
+
+def test_rate_limit_and_summary(alogger, capsys) -> None:
+    logger = alogger.Logger("x", format="{message}", rate=1, burst=2)
+    for i in range(5):
+        logger.warning("hot", str(i))
+    assert lines(capsys) == ["hot 0", "hot 1"]
+    alogger.clock[0] += 1
+    logger.warning("hot", "again")
+    assert lines(capsys) == ["suppressed 3 similar messages: hot", "hot again"]
+
+
+def test_explicit_key(alogger, capsys) -> None:
+    logger = alogger.Logger("x", format="{message}", rate=1, burst=1)
+    for i in range(3):
+        logger.error(f"item {i} failed", key="item failed")
+    assert lines(capsys) == ["item 0 failed"]
+
+
+def test_logger_bucket_checked_first(alogger, capsys) -> None:
+    logger = alogger.Logger(
+        "x", format="{message}", rate=1, burst=2, logger_rate=10, logger_burst=1
+    )
+    logger.info("a", "1")
+    logger.info("a", "2")
+    alogger.clock[0] += 0.1
+    logger.info("a", "3")
+    assert lines(capsys) == ["a 1", "a 3"]
+    logger.flush_suppressed()
+    assert lines(capsys) == ["suppressed 1 messages"]
+
+
+def test_logger_bucket_unique_messages(alogger, capsys) -> None:
+    logger = alogger.Logger("x", format="{message}", logger_rate=10, logger_burst=1)
+    for i in range(10000):
+        logger.error(f"item {i} failed")
+    logger.flush_suppressed()
+    assert lines(capsys) == ["item 0 failed", "suppressed 9999 messages"]
+    assert not logger._suppressed
+
+
+def test_full_table_flushes_one_record(alogger, capsys) -> None:
+    logger = alogger.Logger("x", format="{message}", rate=1, burst=1, max_keys=8)
+    for i in range(20):
+        logger.warning(f"item {i}")
+        logger.warning(f"item {i}")
+    out = lines(capsys)
+    assert [line for line in out if line.startswith("suppressed")] == [
+        "suppressed 8 messages",
+        "suppressed 8 messages",
+    ]
+    assert len(out) == 22
+    assert len(logger._suppressed) == 4
+
+
+def test_buckets_bounded(alogger, capsys) -> None:
+    logger = alogger.Logger("x", format="{message}", rate=1, burst=1, max_keys=8)
+    for i in range(100):
+        logger.warning(f"item {i}")
+    assert len(logger._buckets) == 8
+
+
+def test_suppressed_flushed_on_timer(alogger, capsys) -> None:
+    logger = alogger.Logger(
+        "x", format="{message}", rate=1, burst=1, flush_interval=5
+    )
+    logger.warning("a")
+    logger.warning("a")
+    capsys.readouterr()
+    alogger.clock[0] += 5
+    logger.warning("b")
+    assert lines(capsys) == ["suppressed 1 similar messages: a", "b"]
+    assert not logger._suppressed
+
+
+def test_sampling_not_summarised(alogger, capsys, monkeypatch) -> None:
+    logger = alogger.Logger(
+        "x", format="{message}", rate=10, sample={alogger.Level.DEBUG: 0.5}
+    )
+    values = iter([0.9, 0.9, 0.1])
+    monkeypatch.setattr(alogger.random, "random", lambda: next(values))
+    for _ in range(3):
+        logger.debug("d")
+    assert lines(capsys) == ["d"]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"burst": 0.5}, {"logger_burst": 0}, {"rate": 0}, {"sample": {"x": 1.5}}],
+)
+def test_validation(alogger, kwargs) -> None:
+    with pytest.raises(AssertionError):
+        alogger.Logger("x", **kwargs)
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import sys
+from typing import Iterator
+
+import pytest
+
+from alibrary.aparser.aparser import (
+    Command,
+    Data,
+    Option,
+    Parser,
+    ReturnData,
+    return_data_class,
+)
+
+
+def parser(*args: str) -> Parser:
+    return Parser(
+        [
+            Option("verbose", "be loud"),
+            Option("count", "how many", argument=int, default=3),
+            Option("colour", "use colours"),
+            Option("no-cache", "skip the cache"),
+            Option("dry-run", "do not write"),
+        ],
+        data=Data("file", required=False),
+        args=["prog", *args],
+    )
+
+
+def test_exact_prefix_and_negation() -> None:
+    data = parser("--verb", "--no-col", "--cou=5", "a", "b").parse()
+    assert data.verbose is True
+    assert data.colour is False
+    assert data.count == 5
+    assert data.file == "a b"
+
+
+def test_negated_option_prefix() -> None:
+    assert getattr(parser("--no-ca").parse(), "no-cache") is True
+
+
+@pytest.mark.parametrize("arg", ["--co", "--he", "--hel", "--he=x", "--nope"])
+def test_ambiguous_or_unknown_rejected(arg: str) -> None:
+    with pytest.raises(SystemExit) as exc:
+        parser(arg).parse()
+    assert exc.value.code == 1
+
+
+def test_help_search(capsys) -> None:
+    with pytest.raises(SystemExit) as exc:
+        parser("--help=colo").parse()
+    assert exc.value.code == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "options:",
+        " --colour=<str>\tuse colours",
+    ]
+    assert [option.name for option in parser().search("o")] == [
+        "help",
+        "verbose",
+        "count",
+        "colour",
+        "no-cache",
+        "dry-run",
+    ]
+
+
+def test_slotted_result() -> None:
+    data = parser("--verbose").parse()
+    assert isinstance(data, ReturnData)
+    assert "verbose" in type(data).__slots__
+    assert type(data) is type(parser().parse())
+    assert repr(data) == "{'verbose': ('bool', True), 'count': ('int', 3)}"
+
+
+def test_result_class_cache_bounded() -> None:
+    assert return_data_class.cache_info().maxsize is not None
+
+
+def test_non_identifier_names() -> None:
+    data = parser("--dry").parse()
+    assert getattr(data, "dry-run") is True
+    assert "dry-run" in repr(data)
+
+
+@pytest.fixture
+def tool(tmp_path, monkeypatch) -> Iterator[str]:
+    (tmp_path / "aparser_test_tool.py").write_text(
+        "calls = []\n\n\ndef main(data):\n    calls.append(data)\n    return data\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "aparser_test_tool"
+    sys.modules.pop("aparser_test_tool", None)
+
+
+def commands(tool: str, *args: str) -> Parser:
+    return Parser(
+        [Option("verbose", "be loud")],
+        args=["prog", *args],
+        commands=[
+            Command(
+                "run",
+                f"{tool}:main",
+                "run it",
+                [Option("count", "how many", argument=int)],
+                Data("target"),
+            ),
+            Command("other", "aparser_test_missing:main", "never imported"),
+        ],
+    )
+
+
+def test_command_dispatch(tool: str) -> None:
+    parser = commands(tool, "--verbose", "run", "--count=2", "x")
+    assert tool not in sys.modules
+    data = parser.run()
+    assert parser.command and parser.command.name == "run"
+    assert sys.modules[tool].calls == [data]
+    assert (data.verbose, data.count, data.target) == (True, 2, "x")
+    assert "aparser_test_missing" not in sys.modules
+
+
+@pytest.mark.parametrize("args", [(), ("nope",), ("run",)])
+def test_command_errors(tool: str, args: tuple[str, ...]) -> None:
+    with pytest.raises(SystemExit) as exc:
+        commands(tool, *args).run()
+    assert exc.value.code == 1
+    assert tool not in sys.modules
+
+
+def test_command_with_data_rejected() -> None:
+    with pytest.raises(AssertionError):
+        Parser(data=Data("file"), args=["prog"], commands=[Command("run", "m:f")])
+
+
+def test_command_help(tool: str, capsys) -> None:
+    with pytest.raises(SystemExit):
+        commands(tool, "--help").parse()
+    out = capsys.readouterr().out
+    assert "Usage:\tprog [options] <command>" in out
+    assert " run\trun it" in out